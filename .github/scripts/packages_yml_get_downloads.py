@@ -1,11 +1,15 @@
 """Update downloads count in packages.yml from pepy.tech badge numbers."""
 
+import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from ruamel.yaml import YAML
+from urllib3.util.retry import Retry
 
 yaml = YAML()
 # Preserve quotes, comments, and formatting
@@ -14,6 +18,36 @@ yaml.width = 4096  # Prevent line wrapping
 
 PACKAGE_YML = Path(__file__).parents[2] / "reference" / "packages.yml"
 
+# Local sidecar cache of fetched counts, keyed by package name. Reruns (e.g. after
+# a network failure) pick up where the previous run stopped.
+PEPY_CACHE = Path(__file__).parents[2] / ".cache" / "pepy.json"
+
+# Number of badge fetches in flight at once
+MAX_WORKERS = 8
+
+# Write fetched counts to the sidecar cache every N fetched packages
+CHECKPOINT_EVERY = 25
+
+# Text nodes in the badge SVG; the last one holds the downloads count
+TEXT_PATTERN = re.compile(rb"<text[^>]*>([^<]+)</text>")
+
+# Shared session so pepy.tech connections are kept alive across all fetches.
+# Every fetch goes to one host, with one pooled connection per worker, and
+# rate limits or server errors are retried instead of aborting the run.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_WORKERS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
 
 def _get_downloads(p: dict) -> int:
     """Get downloads count from pepy.tech badge SVG.
@@ -29,15 +63,17 @@ def _get_downloads(p: dict) -> int:
     """
     url = f"https://pepy.tech/badge/{p['name']}/month"
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
-        svg = response.text
+        svg = response.content
     except requests.RequestException as e:
         msg = f"Failed to fetch downloads for {p['name']}: {e}"
         raise requests.RequestException(msg) from e
 
-    texts = re.findall(r"<text[^>]*>([^<]+)</text>", svg)
-    latest = texts[-1].strip() if texts else "0"
+    last = None
+    for m in TEXT_PATTERN.finditer(svg):
+        last = m
+    latest = last.group(1).decode().strip() if last else "0"
 
     # Parse "1.2k", "3.4M", "12,345" -> int
     latest = latest.replace(",", "")
@@ -48,35 +84,94 @@ def _get_downloads(p: dict) -> int:
     return int(float(latest))
 
 
+def _save(data: dict) -> None:
+    """Write the package registry back to packages.yml.
+
+    Args:
+        data: Parsed packages.yml document.
+    """
+    # Write to a temp file and swap it in so an interrupted run can't truncate it
+    tmp = PACKAGE_YML.with_suffix(".yml.tmp")
+    with tmp.open("w") as f:
+        yaml.dump(data, f)
+    tmp.replace(PACKAGE_YML)
+
+
+def _load_cache() -> dict[str, dict]:
+    """Load the sidecar pepy.tech cache.
+
+    Returns:
+        Mapping of package name to `{"downloads": int, "fetched_at": str}`.
+    """
+    if not PEPY_CACHE.exists():
+        return {}
+    return json.loads(PEPY_CACHE.read_text())
+
+
+def _save_cache(cache: dict[str, dict]) -> None:
+    """Write the sidecar pepy.tech cache.
+
+    Args:
+        cache: Mapping of package name to fetched downloads and timestamp.
+    """
+    PEPY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = PEPY_CACHE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    tmp.replace(PEPY_CACHE)
+
+
 current_datetime = datetime.now(UTC)
 yesterday = current_datetime - timedelta(days=1)
+yesterday_iso = yesterday.isoformat()
+current_iso = current_datetime.isoformat()
 
 with PACKAGE_YML.open() as f:
     data = yaml.load(f)
 
+cache = _load_cache()
+
 seen = set()
+stale = []
 for p in data["packages"]:
     if p["name"] in seen:
         msg = f"Duplicate package: {p['name']}"
         raise ValueError(msg)
     seen.add(p["name"])
-    downloads_updated_at_str = p.get("downloads_updated_at")
-    downloads_updated_at = (
-        datetime.fromisoformat(downloads_updated_at_str)
-        if downloads_updated_at_str
-        else None
-    )
-
-    if downloads_updated_at is not None and downloads_updated_at > yesterday:
+    # Timestamps are written as UTC ISO-8601, which sorts lexically
+    downloads_updated_at = p.get("downloads_updated_at")
+    if downloads_updated_at and downloads_updated_at > yesterday_iso:
         print(f"done: {p['name']}: {p['downloads']}")  # noqa: T201
         continue
 
-    p["downloads"] = _get_downloads(p)
-    p["downloads_updated_at"] = current_datetime.isoformat()
-    with PACKAGE_YML.open("w") as f:
-        yaml.dump(data, f)
-    print(f"{p['name']}: {p['downloads']}")  # noqa: T201
-
+    cached = cache.get(p["name"])
+    if cached is not None and cached["fetched_at"] > yesterday_iso:
+        p["downloads"] = cached["downloads"]
+        p["downloads_updated_at"] = cached["fetched_at"]
+        print(f"cached: {p['name']}: {p['downloads']}")  # noqa: T201
+        continue
 
-with PACKAGE_YML.open("w") as f:
-    yaml.dump(data, f)
+    stale.append(p)
+
+# Fetch stale packages concurrently; results come back in submission order
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+try:
+    results = zip(stale, executor.map(_get_downloads, stale), strict=True)
+    for i, (p, downloads) in enumerate(results, 1):
+        p["downloads"] = downloads
+        p["downloads_updated_at"] = current_iso
+        cache[p["name"]] = {
+            "downloads": downloads,
+            "fetched_at": p["downloads_updated_at"],
+        }
+        print(f"{p['name']}: {p['downloads']}")  # noqa: T201
+        # Checkpoint periodically so progress survives a hard kill, which skips
+        # the save in the finally block below
+        if i % CHECKPOINT_EVERY == 0:
+            _save_cache(cache)
+finally:
+    # On a failed fetch, drop the fetches that haven't started and keep every
+    # count fetched so far, so the rerun only fetches what is left
+    executor.shutdown(cancel_futures=True)
+    _save_cache(cache)
+
+_save(data)
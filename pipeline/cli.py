@@ -267,6 +267,15 @@ def main() -> None:
         action="store_true",
         help="Watch for file changes",
     )
+    build_parser.add_argument(
+        "--clean",
+        action="store_true",
+        help=(
+            "Remove the build directory and rebuild every file. Needed after "
+            "changing the pipeline code or link maps, since sources that did "
+            "not change are otherwise left as built"
+        ),
+    )
     build_parser.set_defaults(func=build_command)
 
     # Move command
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 
 
 def build_command(
-    args: Any,  # noqa: ARG001, ANN401
+    args: Any,  # noqa: ANN401
     src_dir: str = "src",
     build_dir: str = "build",
 ) -> int:
@@ -22,8 +22,8 @@ def build_command(
     orchestrates the build process.
 
     Args:
-        args: Command line arguments (not used in this function, but
-            included for compatibility with other commands).
+        args: Command line arguments. If `args.clean` is set, the build
+            directory is removed and every file is rebuilt.
         src_dir: Path to the source directory containing documentation files.
             Defaults to "src".
         build_dir: Path to the build directory where files will be copied.
@@ -49,6 +49,7 @@ def build_command(
 
     # Initialize builder and build docs
     builder = DocumentationBuilder(src_dir_path, build_dir_path)
-    builder.build_all()
+    clean = getattr(args, "clean", False) if args else False
+    builder.build_all(clean=clean)
     logger.info("Documentation built successfully in %s", build_dir_path)
     return 0
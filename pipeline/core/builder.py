@@ -1,25 +1,449 @@
 """Documentation builder implementation."""
 
+import contextlib
+import functools
 import json
 import logging
+import multiprocessing
+import os
 import re
 import shutil
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum, auto
 from pathlib import Path
+from typing import Any
 
 import yaml
 from tqdm import tqdm
 
 from pipeline.preprocessors import preprocess_markdown
 
+try:
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Batches with at least this many files are built in worker processes. Smaller
+# batches (e.g. a handful of files changed during `docs dev`) stay in-process,
+# where pool startup would cost more than it saves.
+PARALLEL_BUILD_MIN_FILES = 64
+
+# Number of files handed to a worker process at a time
+PARALLEL_BUILD_CHUNKSIZE = 16
+
+# File extensions (lowercased) that are built; everything else is skipped
+COPY_EXTENSIONS = frozenset(
+    {
+        ".mdx",
+        ".md",
+        ".json",
+        ".svg",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".yml",
+        ".yaml",
+        ".css",
+        ".js",
+    }
+)
+MARKDOWN_EXTENSIONS = frozenset({".md", ".mdx"})
+
+# Files shared between the Python and JavaScript builds
+SHARED_DIR_NAMES = frozenset({"images", "snippets"})
+SHARED_ROOT_FILES = frozenset({"index.mdx", "use-these-docs.mdx"})
+SHARED_EXTENSIONS = frozenset({".js", ".css"})
+
+# docs.yml files at least this large are streamed to disk with `json.dump`
+# instead of being serialized into one in-memory (and cached) JSON blob.
+STREAM_JSON_MIN_BYTES = 1_000_000
+
+# Shared tqdm options for the build progress bars. Redraws are throttled, and
+# the bars are disabled entirely when stderr is not a TTY (e.g. in CI).
+PROGRESS_BAR_OPTIONS: dict[str, Any] = {
+    "unit": "file",
+    "ncols": 80,
+    "bar_format": "{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+    "mininterval": 0.2,
+    "maxinterval": 1.0,
+    "disable": None,
+}
+
+# Match markdown links and HTML links/anchors
+# This handles both [text](/oss/path) and <a href="/oss/path">. The builder
+# does not apply it directly: it is the reference pattern that `_sub_oss_links`
+# must reproduce, and the tests check the two against each other.
+OSS_LINK_PATTERN = re.compile(r'(\[.*?\]\(|\bhref="|")(/oss/[^")\s]+)([")\s])')
+# The URL group of OSS_LINK_PATTERN on its own
+OSS_URL_PATTERN = re.compile(r'/oss/[^")\s]+')
+
+# Snippet /oss/ links containing any of these are left as absolute paths
+SNIPPET_OSS_LINK_SKIP = ("images", "/oss/python", "/oss/javascript")
+
+
+# Footer appended to every page built from src/, using Mintlify Callout components.
+# Only the edit URL varies per page.
+SOURCE_LINKS_TEMPLATE = (
+    "\n\n---\n\n"
+    '<Callout icon="pen-to-square" iconType="regular">\n'
+    "    [Edit the source of this page on GitHub.]({edit_url})\n"
+    "</Callout>\n"
+    '<Tip icon="terminal" iconType="regular">\n'
+    "    [Connect these docs programmatically](/use-these-docs) to Claude, VSCode, "
+    "and more via MCP for"
+    "    real-time answers.\n"
+    "</Tip>\n"
+)
+
+
+def _find_oss_url(content: str, marker: str, start: int) -> tuple[int, int] | None:
+    """Find the next /oss/ link URL that directly follows a marker.
+
+    Args:
+        content: The markdown content to search.
+        marker: Text ending in "/oss/" that the URL must start within.
+        start: Index to search from.
+
+    Returns:
+        Start and end index of the URL, or None if there is no such URL. The
+        URL must be followed by a terminator, as `OSS_LINK_PATTERN` requires.
+    """
+    offset = len(marker) - len("/oss/")
+    index = content.find(marker, start)
+    while index != -1:
+        match = OSS_URL_PATTERN.match(content, index + offset)
+        if match and match.end() < len(content):
+            return match.span()
+        index = content.find(marker, index + 1)
+    return None
+
+
+def _sub_oss_links(content: str, rewrite: Callable[[str], str]) -> str:
+    """Rewrite the URL of every `OSS_LINK_PATTERN` link in markdown or HTML.
+
+    Produces the same result as substituting the URL group of
+    `OSS_LINK_PATTERN`, without running its lazy `[.*?](` prefix. That prefix
+    makes the regex engine rescan the rest of the line from every `[`, which
+    is quadratic on long lines full of brackets. Instead, the next `"/oss/`
+    and `](/oss/` occurrences are found with substring searches, and a
+    `](/oss/` link starts at the first `[` before it on the same line. As with
+    the regex, the match that starts first wins and matches never overlap.
+
+    Args:
+        content: The markdown content to process.
+        rewrite: Function mapping each link URL to its replacement.
+
+    Returns:
+        Content with every link URL replaced by `rewrite(url)`.
+    """
+    parts: list[str] = []
+    copied_to = 0
+    # Matches can't start before the end (terminator included) of the last one
+    match_from = 0
+    # Next `"/oss/...` URL, and next `[...](/oss/...` URL with its "[" index
+    quoted: tuple[int, int] | None = (0, 0)
+    linked: tuple[int, int] | None = (0, 0)
+    bracket = -1
+    # Start and end of the line holding the linked URL
+    line_start = line_end = -1
+    # There is no "[" on that line before this index
+    no_bracket_to = 0
+
+    while True:
+        if quoted is not None and quoted[0] - 1 < match_from:
+            quoted = _find_oss_url(content, '"/oss/', match_from)
+
+        if linked is not None and bracket < match_from:
+            search_from = match_from
+            while True:
+                linked = _find_oss_url(content, "](/oss/", search_from)
+                if linked is None:
+                    break
+                url_start = linked[0]
+                if url_start > line_end:
+                    line_start = content.rfind("\n", 0, url_start) + 1
+                    line_end = content.find("\n", url_start)
+                    if line_end == -1:
+                        line_end = len(content)
+                bracket = content.find(
+                    "[",
+                    max(line_start, match_from, no_bracket_to),
+                    url_start - len("]("),
+                )
+                if bracket != -1:
+                    break
+                search_from = no_bracket_to = url_start
+
+        if quoted is not None and (linked is None or quoted[0] - 1 < bracket):
+            start, end = quoted
+        elif linked is not None:
+            start, end = linked
+        else:
+            break
+
+        parts.append(content[copied_to:start])
+        parts.append(rewrite(content[start:end]))
+        copied_to = end
+        match_from = end + 1
+
+    if not parts:
+        return content
+    parts.append(content[copied_to:])
+    return "".join(parts)
+
+
+def _relativize_snippet_oss_url(url: str) -> str:
+    """Convert an /oss/ link URL in a snippet to a language-agnostic relative path.
+
+    IMPORTANT: the conversion creates relative paths that resolve from the
+    parent page's directory.
+    - /oss/providers/groq → ../providers/groq
+
+    Args:
+        url: Absolute /oss/ URL of the link.
+
+    Returns:
+        The URL made relative, if it should be.
+    """
+    # Only convert /oss/ paths that don't contain 'images' or '/oss/python' or '/oss/javascript'
+    if any(part in url for part in SNIPPET_OSS_LINK_SKIP):
+        return url
+    # Convert to relative path that works from oss/python/* or oss/js/*
+    # e.g., /oss/releases/langchain-v1 becomes ../releases/langchain-v1
+    return "../" + url[len("/oss/") :]
+
+
+@functools.lru_cache(maxsize=32)
+def _yaml_file_to_json(yaml_file_path: Path, mtime_ns: int) -> bytes:  # noqa: ARG001
+    """Parse a YAML file and serialize it as indented JSON.
+
+    Results are cached on the source path and modification time, so a docs.yml
+    that is built into several output trees is only parsed once per change.
+
+    Args:
+        yaml_file_path: Path to the source YAML file.
+        mtime_ns: Modification time of the source file, part of the cache key.
+
+    Returns:
+        The UTF-8 encoded JSON document.
+    """
+    yaml_content = yaml.load(yaml_file_path.read_bytes(), Loader=SafeLoader)
+    return json.dumps(yaml_content, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _stream_yaml_file_to_json(yaml_file_path: Path, json_file_path: Path) -> None:
+    """Parse a YAML file and write it as indented JSON without building a blob.
+
+    Writes the same document as `_yaml_file_to_json`, but `json.dump` encodes
+    it chunk by chunk into a large write buffer, so peak memory stays near the
+    size of the parsed YAML. The JSON is written to a temp file that replaces
+    the output only once complete, so a failed dump leaves no truncated file
+    that the up-to-date check would then keep.
+
+    Args:
+        yaml_file_path: Path to the source YAML file.
+        json_file_path: Path where the JSON file should be written.
+    """
+    yaml_content = yaml.load(yaml_file_path.read_bytes(), Loader=SafeLoader)
+    tmp = json_file_path.with_suffix(".json.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(yaml_content, f, indent=2, ensure_ascii=False)
+        tmp.replace(json_file_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _scan_dir(path: str) -> tuple[list[Path], list[str]]:
+    """List the files and subdirectories of a single directory.
+
+    Args:
+        path: Directory to scan.
+
+    Returns:
+        A tuple of (file paths, subdirectory paths), in scandir order.
+        Symlinked directories are neither listed as files nor as subdirectories.
+    """
+    files = []
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                files.append(Path(entry.path))
+    return files, subdirs
+
+
+def _iter_files(root: Path) -> Iterator[Path]:
+    """Recursively yield the files under a directory.
+
+    Uses `os.scandir`, whose directory entries cache the file type, instead of
+    `rglob("*")` followed by a `stat` per path for `is_file()`. Files come out
+    in the same order as from `rglob("*")`: the files of each subdirectory are
+    listed while its parent is scanned, and the scanned subdirectories are then
+    descended into last first. Like `rglob`, symlinked directories are not
+    descended into.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Path of each regular file (or symlink to one) under root.
+    """
+    files, subdirs = _scan_dir(os.fspath(root))
+    yield from files
+    stack = [subdirs]
+    while stack:
+        for subdir in stack.pop():
+            files, subdirs = _scan_dir(subdir)
+            yield from files
+            stack.append(subdirs)
+
+
+def _sweep_dir(root: str, keep: set[str]) -> int:
+    """Delete files under a directory that are not in a set of paths to keep.
+
+    Subdirectories left empty by the sweep are removed as well.
+
+    Args:
+        root: Directory to sweep.
+        keep: String paths, joined onto root the way `os.scandir` reports
+            them, of the files to leave in place.
+
+    Returns:
+        Number of files deleted.
+    """
+    removed = 0
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                removed += _sweep_dir(entry.path, keep)
+                with contextlib.suppress(OSError):
+                    os.rmdir(entry.path)  # noqa: PTH106
+            elif entry.path not in keep:
+                os.unlink(entry.path)  # noqa: PTH108
+                removed += 1
+    return removed
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 text file in a single decode pass.
+
+    Reading bytes and decoding once avoids the incremental text-mode decoder.
+    Newlines are normalized to match what text mode would have produced.
+
+    Args:
+        path: Path to the file to read.
+
+    Returns:
+        The decoded file content with universal newlines.
+    """
+    content = path.read_bytes().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write a file through a temp file that replaces it once complete.
+
+    Incremental builds keep any output newer than its source, so an
+    interrupted write must not leave a truncated file behind.
+
+    Args:
+        path: Path of the file to write.
+        data: Content to write.
+    """
+    tmp = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _copy_file_atomic(src: Path, dst: Path) -> None:
+    """Copy a file through a temp file that replaces the destination once complete.
+
+    Args:
+        src: Path of the file to copy.
+        dst: Path to copy it to.
+    """
+    tmp = dst.with_name(f"{dst.name}.tmp")
+    try:
+        shutil.copyfile(src, tmp)
+        tmp.replace(dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+class _FileKind(Enum):
+    """Where a source file is built to, as decided by `_classify`."""
+
+    OSS = auto()
+    """Versioned content, built once per language."""
+    LANGSMITH = auto()
+    """Unversioned LangSmith content."""
+    SHARED = auto()
+    """Shared between versions (images, snippets, docs.json, etc.)."""
+    SIMPLE = auto()
+    """Any other file, built to the same relative path."""
+
+
+def _is_shared(parts: tuple[str, ...], name: str, suffix: str) -> bool:
+    """Check if a file should be shared between versions.
+
+    Args:
+        parts: Path components of the file relative to the source directory.
+        name: File name.
+        suffix: Lowercased file suffix.
+
+    Returns:
+        True if the file should be shared, False if it should be version-specific.
+    """
+    # docs.json and the root index/use-these-docs pages should be shared
+    if name == "docs.json" or (len(parts) == 1 and name in SHARED_ROOT_FILES):
+        return True
+    # Images and snippets directories should be shared
+    if not SHARED_DIR_NAMES.isdisjoint(parts):
+        return True
+    # JavaScript and CSS files should be shared (used for custom scripts/styles)
+    return suffix in SHARED_EXTENSIONS
+
+
+def _classify(parts: tuple[str, ...], name: str, suffix: str) -> _FileKind:
+    """Decide how a source file is built.
+
+    Args:
+        parts: Path components of the file relative to the source directory.
+        name: File name.
+        suffix: Lowercased file suffix.
+
+    Returns:
+        The kind of build the file needs.
+    """
+    # langsmith/ is unversioned even for files that would otherwise be shared
+    if parts[0] == "langsmith":
+        return _FileKind.LANGSMITH
+    if _is_shared(parts, name, suffix):
+        return _FileKind.SHARED
+    if parts[0] == "oss":
+        return _FileKind.OSS
+    return _FileKind.SIMPLE
+
 
 class DocumentationBuilder:
     """Builds documentation from source files to build directory.
 
     This class handles the process of copying supported documentation files
     from a source directory to a build directory, maintaining the directory
-    structure and preserving file metadata.
+    structure.
 
     Attributes:
         src_dir: Path to the source directory containing documentation files.
@@ -36,22 +460,13 @@ class DocumentationBuilder:
         """
         self.src_dir = src_dir
         self.build_dir = build_dir
+        # Absolute source directory, used to relativize every built file
+        self._src_abs = src_dir.absolute()
+        # String prefix (with trailing separator) of paths inside src_dir
+        self._src_prefix = os.path.join(self._src_abs, "")  # noqa: PTH118
 
         # File extensions to copy directly
-        self.copy_extensions: set[str] = {
-            ".mdx",
-            ".md",
-            ".json",
-            ".svg",
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".gif",
-            ".yml",
-            ".yaml",
-            ".css",
-            ".js",
-        }
+        self.copy_extensions: set[str] = set(COPY_EXTENSIONS)
 
         # Mapping of language codes to full names for URLs
         self.language_url_names = {
@@ -59,17 +474,36 @@ class DocumentationBuilder:
             "js": "javascript",
         }
 
-    def build_all(self) -> None:
+        # Output directories already created during this build
+        self._created_dirs: set[Path] = set()
+        # Versioned output prefixes, paired with the oss/ subdirectory holding
+        # the language-specific sources that may override them
+        self._override_prefixes = tuple(
+            (os.path.join(build_dir, "oss", language, ""), language)  # noqa: PTH118
+            for language in ("python", "javascript")
+        )
+        # Modification times of override directories seen during this build
+        self._override_dir_mtimes: dict[Path, int | None] = {}
+        # Outputs written or kept by the current `build_all`, for the final sweep
+        self._built_paths: set[str] | None = None
+
+    def build_all(self, *, clean: bool = False) -> None:
         """Build all documentation files from source to build directory.
 
-        This method clears the build directory and creates version-specific builds
-        for both Python and JavaScript documentation.
+        This method creates version-specific builds for both Python and
+        JavaScript documentation. Outputs that are already up to date are left
+        alone, and files in the build directory that the build did not produce
+        are deleted afterwards.
 
         The process includes:
-        1. Clearing the existing build directory
+        1. Clearing the existing build directory, if `clean` is set
         2. Building Python version with python/ prefix
         3. Building JavaScript version with javascript/ prefix
         4. Copying shared files (images, configs, etc.)
+        5. Deleting stale files left over from earlier builds
+
+        Args:
+            clean: Remove the whole build directory first and rebuild every file.
 
         Displays:
             Progress bars showing build progress for each version.
@@ -81,8 +515,11 @@ class DocumentationBuilder:
         )
 
         # Clear build directory
-        if self.build_dir.exists():
+        if clean and self.build_dir.exists():
             shutil.rmtree(self.build_dir)
+        self._created_dirs.clear()
+        self._override_dir_mtimes.clear()
+        self._built_paths = set()
         self.build_dir.mkdir(parents=True, exist_ok=True)
 
         # Build LangGraph versioned content (oss/ -> oss/python/ and oss/javascript/)
@@ -99,29 +536,61 @@ class DocumentationBuilder:
         logger.info("Copying shared files...")
         self._copy_shared_files()
 
+        # Remove outputs whose sources were deleted or are no longer built
+        removed_count = _sweep_dir(os.fspath(self.build_dir), self._built_paths)
+        if removed_count:
+            logger.info(
+                "Removed %d stale files from the build directory", removed_count
+            )
+        self._built_paths = None
+        self._created_dirs.clear()
+        self._override_dir_mtimes.clear()
+
         logger.info("✅ New structure build complete")
 
+    def _ensure_parent_dir(self, output_path: Path) -> None:
+        """Create the parent directory of an output path if needed.
+
+        Directories created during the current build are remembered, so files
+        sharing a parent skip the repeated `mkdir(parents=True)` syscalls.
+
+        Args:
+            output_path: Path of the file that is about to be written.
+        """
+        parent = output_path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+
     def _convert_yaml_to_json(self, yaml_file_path: Path, output_path: Path) -> None:
         """Convert a YAML file to JSON format.
 
-        This method loads a docs.yml file using YAML safe_load and writes
-        the corresponding docs.json file to the build directory.
+        This method loads a docs.yml file using a YAML safe loader and writes
+        the corresponding docs.json file to the build directory. Nothing is
+        written if the JSON file is already up to date, as decided by
+        `_is_up_to_date`.
 
         Args:
             yaml_file_path: Path to the source YAML file.
             output_path: Path where the JSON file should be written.
         """
         try:
-            # Load YAML content
-            with yaml_file_path.open("r", encoding="utf-8") as yaml_file:
-                yaml_content = yaml.safe_load(yaml_file)
-
             # Convert output path from .yml to .json
             json_output_path = output_path.with_suffix(".json")
 
+            # Skip the conversion if the JSON output is already up to date
+            if self._is_up_to_date(yaml_file_path, json_output_path):
+                return
+
             # Write JSON content
-            with json_output_path.open("w", encoding="utf-8") as json_file:
-                json.dump(yaml_content, json_file, indent=2, ensure_ascii=False)
+            stat = yaml_file_path.stat()
+            if stat.st_size >= STREAM_JSON_MIN_BYTES:
+                _stream_yaml_file_to_json(yaml_file_path, json_output_path)
+            else:
+                _write_bytes_atomic(
+                    json_output_path,
+                    _yaml_file_to_json(yaml_file_path, stat.st_mtime_ns),
+                )
 
         except yaml.YAMLError:
             logger.exception("Failed to parse YAML file %s", yaml_file_path)
@@ -143,25 +612,21 @@ class DocumentationBuilder:
         if not target_language:
             return content
 
-        def rewrite_link(match: re.Match) -> str:
-            """Rewrite a single link match."""
-            pre = match.group(1)  # Everything before the URL
-            url = match.group(2)  # The URL
-            post = match.group(3)  # Everything after the URL
+        # Cheap substring check lets most files skip the regex scan entirely
+        if "/oss/" not in content:
+            return content
 
-            # Only rewrite absolute /oss/ paths that don't contain 'images'
-            if url.startswith("/oss/") and "images" not in url:
-                parts = url.split("/")
-                # Insert full language name after "oss"
-                parts.insert(2, self.language_url_names[target_language])
-                url = "/".join(parts)
+        # Full language name inserted after "oss", e.g. /oss/foo -> /oss/python/foo
+        language_prefix = f"/oss/{self.language_url_names[target_language]}/"
 
-            return f"{pre}{url}{post}"
+        def rewrite_url(url: str) -> str:
+            """Rewrite a single link URL."""
+            # Only absolute /oss/ paths are passed in; skip 'images' ones
+            if "images" in url:
+                return url
+            return language_prefix + url[len("/oss/") :]
 
-        # Match markdown links and HTML links/anchors
-        # This handles both [text](/oss/path) and <a href="/oss/path">
-        pattern = r'(\[.*?\]\(|\bhref="|")(/oss/[^")\s]+)([")\s])'
-        return re.sub(pattern, rewrite_link, content)
+        return _sub_oss_links(content, rewrite_url)
 
     def _add_suggested_edits_link(self, content: str, input_path: Path) -> str:
         """Add 'Edit Source' link to the end of markdown content.
@@ -177,32 +642,21 @@ class DocumentationBuilder:
             The content with the source links appended (if applicable).
         """
         try:
-            # Only add links for files in the src/ directory
-            relative_path = input_path.absolute().relative_to(self.src_dir.absolute())
+            # Only add links for files in the src/ directory. A prefix check
+            # avoids relative_to raising ValueError for every file outside it.
+            input_str = os.fspath(input_path.absolute())
+            if not input_str.startswith(self._src_prefix):
+                return content
+            relative_path = input_str[len(self._src_prefix) :]
 
             # Construct the GitHub URLs
             edit_url = (
                 f"https://github.com/langchain-ai/docs/edit/main/src/{relative_path}"
             )
 
-            # Create the callout section with Mintlify Callout component
-            source_links_section = (
-                "\n\n---\n\n"
-                f'<Callout icon="pen-to-square" iconType="regular">\n'
-                f"    [Edit the source of this page on GitHub.]({edit_url})\n"
-                "</Callout>\n"
-                f'<Tip icon="terminal" iconType="regular">\n'
-                f"    [Connect these docs programmatically](/use-these-docs) to Claude, VSCode, and more via MCP for"
-                f"    real-time answers.\n"
-                "</Tip>\n"
-            )
-
             # Append to content
-            return content.rstrip() + source_links_section
+            return content.rstrip() + SOURCE_LINKS_TEMPLATE.format(edit_url=edit_url)
 
-        except ValueError:
-            # File is not within src_dir, return content unchanged
-            return content
         except Exception:
             logger.exception("Failed to add source links for %s", input_path)
             # Return original content if there's an error
@@ -253,13 +707,14 @@ class DocumentationBuilder:
         """
         try:
             # Read the source markdown content
-            with input_path.open("r", encoding="utf-8") as f:
-                content = f.read()
+            content = _read_text(input_path)
 
             # Apply markdown preprocessing
             processed_content = self._process_markdown_content(
                 content, input_path, target_language
             )
+            # Drop the source text so only one copy is live for the remaining passes
+            del content
 
             # Add "Edit Source" link for files in src/ directory
             processed_content = self._add_suggested_edits_link(
@@ -271,8 +726,7 @@ class DocumentationBuilder:
                 output_path = output_path.with_suffix(".mdx")
 
             # Write the processed content
-            with output_path.open("w", encoding="utf-8") as f:
-                f.write(processed_content)
+            _write_bytes_atomic(output_path, processed_content.encode("utf-8"))
 
         except Exception:
             logger.exception("Failed to process markdown file %s", input_path)
@@ -296,16 +750,22 @@ class DocumentationBuilder:
             msg = f"File does not exist: {file_path} this is likely a programming error"
             raise AssertionError(msg)
 
-        relative_path = file_path.absolute().relative_to(self.src_dir.absolute())
+        # Single-file builds come from the watcher, which may outlive output
+        # directories; don't trust directories remembered from earlier builds.
+        self._created_dirs.clear()
+        self._override_dir_mtimes.clear()
+
+        relative_path = file_path.absolute().relative_to(self._src_abs)
+        kind = _classify(relative_path.parts, file_path.name, file_path.suffix.lower())
 
         # Check if this is OSS content that needs versioned building
-        if relative_path.parts[0] == "oss":
+        if kind is _FileKind.OSS:
             self._build_oss_file(file_path, relative_path)
         # Check if this is unversioned content
-        elif relative_path.parts[0] == "langsmith":
+        elif kind is _FileKind.LANGSMITH:
             self._build_unversioned_file(file_path, relative_path)
         # Handle shared files (images, docs.json, etc.)
-        elif self.is_shared_file(file_path):
+        elif kind is _FileKind.SHARED:
             self._build_shared_file(file_path, relative_path)
         # Handle root-level files
         else:
@@ -318,11 +778,6 @@ class DocumentationBuilder:
             file_path: Path to the source file.
             relative_path: Relative path from src_dir.
         """
-        # Skip shared files - they're handled separately
-        if self.is_shared_file(file_path):
-            self._build_shared_file(file_path, relative_path)
-            return
-
         # Build for both Python and JavaScript versions
         oss_relative = relative_path.relative_to(Path("oss"))  # Remove 'oss/' prefix
 
@@ -387,71 +842,110 @@ class DocumentationBuilder:
             return False
 
         # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_parent_dir(output_path)
 
         # Handle special case for docs.yml files
-        if file_path.name == "docs.yml" and file_path.suffix.lower() in {
-            ".yml",
-            ".yaml",
-        }:
+        if file_path.name == "docs.yml":
             self._convert_yaml_to_json(file_path, output_path)
             return True
 
         # Handle supported file extensions
-        if file_path.suffix.lower() in self.copy_extensions:
+        suffix = file_path.suffix.lower()
+        if suffix in self.copy_extensions:
+            # Leave outputs that are newer than their source alone
+            if self._is_up_to_date(file_path, output_path):
+                return True
             # Handle markdown files with preprocessing
-            if file_path.suffix.lower() in {".md", ".mdx"}:
+            if suffix in MARKDOWN_EXTENSIONS:
                 self._process_markdown_file(file_path, output_path, target_language)
                 return True
-            shutil.copy2(file_path, output_path)
+            _copy_file_atomic(file_path, output_path)
             return True
 
         # File was skipped
         return False
 
-    def _build_file_with_progress(self, file_path: Path, pbar: tqdm) -> bool:
-        """Build a single file with progress bar integration.
+    def _record_output(self, file_path: Path, output_path: Path) -> None:
+        """Remember a built file so the `build_all` sweep keeps it.
 
-        This method is similar to build_file but integrates with tqdm progress
-        bar and returns a boolean result instead of printing messages.
+        Args:
+            file_path: Path to the source file.
+            output_path: Output path the file was built to.
+        """
+        if self._built_paths is None:
+            return
+        if file_path.name == "docs.yml":
+            output_path = output_path.with_suffix(".json")
+        elif file_path.suffix.lower() == ".md":
+            output_path = output_path.with_suffix(".mdx")
+        self._built_paths.add(os.fspath(output_path))
+
+    def _is_up_to_date(self, file_path: Path, output_path: Path) -> bool:
+        """Check whether a built file is at least as new as its source.
+
+        Outputs under `oss/python/` and `oss/javascript/` may instead come from a
+        language-specific override of their source. Adding or deleting one
+        updates the modification time of its directory, so these outputs must
+        also be newer than that directory, or than its closest existing parent.
 
         Args:
-            file_path: Path to the source file to be built. Must be within
-                the source directory.
-            pbar: tqdm progress bar instance for updating the description.
+            file_path: Path to the source file.
+            output_path: Output path the file would be built to. A `.md` source
+                is checked against its `.mdx` output.
 
         Returns:
-            True if the file was copied, False if it was skipped.
+            True if the output exists and is not older than the source, nor
+            than any override directory it depends on.
         """
-        # Skip template files
-        if file_path.name == "TEMPLATE.mdx":
+        if file_path.suffix.lower() == ".md":
+            output_path = output_path.with_suffix(".mdx")
+        try:
+            output_mtime_ns = output_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if output_mtime_ns < file_path.stat().st_mtime_ns:
             return False
+        override_dir_mtime_ns = self._override_dir_mtime_ns(output_path)
+        return override_dir_mtime_ns is None or output_mtime_ns > override_dir_mtime_ns
 
-        relative_path = file_path.absolute().relative_to(self.src_dir.absolute())
-        output_path = self.build_dir / relative_path
+    def _override_dir_mtime_ns(self, output_path: Path) -> int | None:
+        """Get the modification time of the directory overriding an output.
 
-        # Update progress bar description with current file
-        pbar.set_postfix_str(f"{relative_path}")
+        For `oss/python/guides/page.mdx` this is `src/oss/python/guides`. When
+        that directory does not exist, the closest existing parent, at most
+        `src/oss`, is used instead, since deleting the directory updated it.
 
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            output_path: Output path of a built file.
 
-        # Handle special case for docs.yml files
-        if file_path.name == "docs.yml" and file_path.suffix.lower() in {
-            ".yml",
-            ".yaml",
-        }:
-            self._convert_yaml_to_json(file_path, output_path)
-            return True
-        # Copy other supported files directly
-        if file_path.suffix.lower() in self.copy_extensions:
-            # Handle markdown files with preprocessing
-            if file_path.suffix.lower() in {".md", ".mdx"}:
-                self._process_markdown_file(file_path, output_path)
-                return True
-            shutil.copy2(file_path, output_path)
-            return True
-        return False
+        Returns:
+            Modification time in nanoseconds, or None if the output is not
+            versioned or no such directory exists.
+        """
+        path = os.fspath(output_path)
+        oss_dir = self._src_abs / "oss"
+        for prefix, language in self._override_prefixes:
+            if path.startswith(prefix):
+                directory = oss_dir / language / Path(path[len(prefix) :]).parent
+                break
+        else:
+            return None
+
+        if directory in self._override_dir_mtimes:
+            return self._override_dir_mtimes[directory]
+
+        mtime_ns = None
+        candidate = directory
+        while True:
+            try:
+                mtime_ns = candidate.stat().st_mtime_ns
+                break
+            except FileNotFoundError:
+                if candidate == oss_dir:
+                    break
+                candidate = candidate.parent
+        self._override_dir_mtimes[directory] = mtime_ns
+        return mtime_ns
 
     def build_files(self, file_paths: list[Path]) -> None:
         """Build specific files by copying them to the build directory.
@@ -474,24 +968,22 @@ class DocumentationBuilder:
             self.build_file(existing_files[0])
             return
 
-        # For multiple files, show progress bar
-        copied_count = 0
-        skipped_count = 0
+        # As in build_file, directories remembered from earlier builds may be gone
+        self._created_dirs.clear()
+        self._override_dir_mtimes.clear()
+
+        jobs: list[tuple[Path, Path, str | None]] = []
+        for file_path in existing_files:
+            relative_path = file_path.absolute().relative_to(self._src_abs)
+            jobs.append((file_path, self.build_dir / relative_path, None))
 
+        # For multiple files, show progress bar
         with tqdm(
-            total=len(existing_files),
+            total=len(jobs),
             desc="Building files",
-            unit="file",
-            ncols=80,
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+            **PROGRESS_BAR_OPTIONS,
         ) as pbar:
-            for file_path in existing_files:
-                result = self._build_file_with_progress(file_path, pbar)
-                if result:
-                    copied_count += 1
-                else:
-                    skipped_count += 1
-                pbar.update(1)
+            copied_count, skipped_count = self._run_build_jobs(jobs, pbar)
 
         logger.info(
             "✅ Build complete: %d files copied, %d files skipped",
@@ -514,61 +1006,57 @@ class DocumentationBuilder:
 
         all_files = [
             file_path
-            for file_path in oss_dir.rglob("*")
-            if file_path.is_file() and not self.is_shared_file(file_path)
+            for file_path in _iter_files(oss_dir)
+            if not self.is_shared_file(file_path)
         ]
 
         if not all_files:
             logger.info("No files found in oss/ directory for %s", output_dir)
             return
 
-        # Process files with progress bar
-        copied_count: int = 0
-        skipped_count: int = 0
+        # One job per output path. Language-specific files override the shared
+        # file with the same output path, whichever of the two is found first.
+        jobs_by_output: dict[Path, tuple[Path, Path, str | None]] = {}
+        override_outputs: set[Path] = set()
+        for file_path in all_files:
+            # Calculate relative path from oss/ directory
+            relative_path = file_path.relative_to(oss_dir)
+
+            is_override = False
+            if relative_path.parts:
+                first_part = relative_path.parts[0]
+                if first_part in ("python", "javascript"):
+                    # Map target_language to expected directory name
+                    expected_dir = (
+                        "python" if target_language == "python" else "javascript"
+                    )
+                    # Skip files that are for a different language
+                    # (i.e. if we're building for python and we encounter
+                    #  `oss/javascript/...`, skip it)
+                    if first_part != expected_dir:
+                        continue
+                    # Remove the language-specific directory from the path
+                    # e.g., "python/concepts/low_level.md" > "concepts/low_level.md"
+                    relative_path = Path(*relative_path.parts[1:])
+                    is_override = True
+
+            # Build to output_dir/ (not `output_dir/oss/`)
+            output_path = self.build_dir / output_dir / relative_path
+            if is_override:
+                override_outputs.add(output_path)
+            elif output_path in override_outputs:
+                continue
+            jobs_by_output[output_path] = (file_path, output_path, target_language)
+
+        jobs = list(jobs_by_output.values())
 
+        # Process files with progress bar
         with tqdm(
-            total=len(all_files),
+            total=len(jobs),
             desc=f"Building {output_dir} files",
-            unit="file",
-            ncols=80,
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+            **PROGRESS_BAR_OPTIONS,
         ) as pbar:
-            for file_path in all_files:
-                # Calculate relative path from oss/ directory
-                relative_path = file_path.relative_to(oss_dir)
-
-                if relative_path.parts:
-                    first_part = relative_path.parts[0]
-                    if first_part in ("python", "javascript"):
-                        # Map target_language to expected directory name
-                        expected_dir = (
-                            "python" if target_language == "python" else "javascript"
-                        )
-                        # Skip files that are for a different language
-                        # (i.e. if we're building for python and we encounter
-                        #  `oss/javascript/...`, skip it)
-                        if first_part != expected_dir:
-                            pbar.update(1)
-                            continue
-                        # Remove the language-specific directory from the path
-                        # e.g., "python/concepts/low_level.md" > "concepts/low_level.md"
-                        relative_path = Path(*relative_path.parts[1:])
-
-                # Build to output_dir/ (not `output_dir/oss/`)
-                output_path = self.build_dir / output_dir / relative_path
-
-                result = self._build_single_file(
-                    file_path,
-                    output_path,
-                    target_language,
-                    pbar,
-                    f"{output_dir}/{relative_path}",
-                )
-                if result:
-                    copied_count += 1
-                else:
-                    skipped_count += 1
-                pbar.update(1)
+            copied_count, skipped_count = self._run_build_jobs(jobs, pbar)
 
         logger.info(
             "✅ %s complete: %d files copied, %d files skipped",
@@ -591,43 +1079,29 @@ class DocumentationBuilder:
 
         all_files = [
             file_path
-            for file_path in src_path.rglob("*")
-            if file_path.is_file() and not self.is_shared_file(file_path)
+            for file_path in _iter_files(src_path)
+            if not self.is_shared_file(file_path)
         ]
 
         if not all_files:
             logger.info("No files found in %s/ directory", source_dir)
             return
 
-        # Process files with progress bar
-        copied_count: int = 0
-        skipped_count: int = 0
+        jobs: list[tuple[Path, Path, str | None]] = []
+        for file_path in all_files:
+            # Calculate relative path from source directory
+            relative_path = file_path.relative_to(src_path)
+            # Build directly to output_dir/
+            output_path = self.build_dir / output_dir / relative_path
+            jobs.append((file_path, output_path, "python"))
 
+        # Process files with progress bar
         with tqdm(
-            total=len(all_files),
+            total=len(jobs),
             desc=f"Building {output_dir} files",
-            unit="file",
-            ncols=80,
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+            **PROGRESS_BAR_OPTIONS,
         ) as pbar:
-            for file_path in all_files:
-                # Calculate relative path from source directory
-                relative_path = file_path.relative_to(src_path)
-                # Build directly to output_dir/
-                output_path = self.build_dir / output_dir / relative_path
-
-                result = self._build_single_file(
-                    file_path,
-                    output_path,
-                    "python",
-                    pbar,
-                    f"{output_dir}/{relative_path}",
-                )
-                if result:
-                    copied_count += 1
-                else:
-                    skipped_count += 1
-                pbar.update(1)
+            copied_count, skipped_count = self._run_build_jobs(jobs, pbar)
 
         logger.info(
             "✅ %s complete: %d files copied, %d files skipped",
@@ -636,93 +1110,64 @@ class DocumentationBuilder:
             skipped_count,
         )
 
-    def _build_single_file(
-        self,
-        file_path: Path,
-        output_path: Path,
-        target_language: str,
-        pbar: tqdm,
-        display_path: str,
-    ) -> bool:
-        """Build a single file with progress bar integration.
-
-        Args:
-            file_path: Path to the source file to be built.
-            output_path: Full output path for the file.
-            target_language: Target language for conditional blocks ("python" or "js").
-            pbar: tqdm progress bar instance for updating the description.
-            display_path: Path to display in progress bar.
-
-        Returns:
-            True if the file was copied, False if it was skipped.
-        """
-        # Skip template files
-        if file_path.name == "TEMPLATE.mdx":
-            return False
-
-        # Update progress bar description with current file
-        pbar.set_postfix_str(display_path)
-
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    def _run_build_jobs(
+        self, jobs: list[tuple[Path, Path, str | None]], pbar: tqdm
+    ) -> tuple[int, int]:
+        """Build a batch of files, fanning out to worker processes when large.
 
-        # Handle special case for docs.yml files
-        if file_path.name == "docs.yml" and file_path.suffix.lower() in {
-            ".yml",
-            ".yaml",
-        }:
-            self._convert_yaml_to_json(file_path, output_path)
-            return True
-        # Copy other supported files
-        if file_path.suffix.lower() in self.copy_extensions:
-            # Handle markdown files with preprocessing
-            if file_path.suffix.lower() in {".md", ".mdx"}:
-                self._process_markdown_file(file_path, output_path, target_language)
-                return True
-            shutil.copy2(file_path, output_path)
-            return True
-        return False
-
-    def _build_version_file_with_progress(
-        self, file_path: Path, version_dir: str, target_language: str, pbar: tqdm
-    ) -> bool:
-        """Build a single file for a specific version with progress bar integration.
+        Each file is built independently, so large batches are spread across a
+        process pool. Results are collected in submission order, and the
+        progress bar is advanced from the main process.
 
         Args:
-            file_path: Path to the source file to be built.
-            version_dir: Directory name for this version (e.g., "python", "javascript").
-            target_language: Target language for conditional blocks ("python" or "js").
-            pbar: tqdm progress bar instance for updating the description.
+            jobs: Tuples of (source path, output path, target language) for each
+                file to build.
+            pbar: tqdm progress bar instance, advanced once per job.
 
         Returns:
-            True if the file was copied, False if it was skipped.
+            A tuple of (copied count, skipped count).
         """
-        relative_path = file_path.absolute().relative_to(self.src_dir.absolute())
-        # Add version prefix to the output path
-        output_path = self.build_dir / version_dir / relative_path
-
-        # Update progress bar description with current file
-        pbar.set_postfix_str(f"{version_dir}/{relative_path}")
+        copied_count = 0
+        skipped_count = 0
 
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not jobs or len(jobs) < PARALLEL_BUILD_MIN_FILES:
+            for file_path, output_path, target_language in jobs:
+                if self._build_single_file_to_path(
+                    file_path, output_path, target_language
+                ):
+                    self._record_output(file_path, output_path)
+                    copied_count += 1
+                else:
+                    skipped_count += 1
+                pbar.update(1)
+            return copied_count, skipped_count
+
+        file_paths, output_paths, target_languages = zip(*jobs, strict=True)
+        # Use spawn so workers don't inherit threads (e.g. tqdm's monitor) via fork.
+        # Each worker builds its own builder once, so chunks only carry the jobs.
+        with ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_build_worker,
+            initargs=(self.src_dir, self.build_dir, self.copy_extensions),
+        ) as executor:
+            results = executor.map(
+                _build_file_in_worker,
+                file_paths,
+                output_paths,
+                target_languages,
+                chunksize=PARALLEL_BUILD_CHUNKSIZE,
+            )
+            for file_path, output_path, result in zip(
+                file_paths, output_paths, results, strict=True
+            ):
+                if result:
+                    self._record_output(file_path, output_path)
+                    copied_count += 1
+                else:
+                    skipped_count += 1
+                pbar.update(1)
 
-        # Handle special case for docs.yml files
-        if file_path.name == "docs.yml" and file_path.suffix.lower() in {
-            ".yml",
-            ".yaml",
-        }:
-            self._convert_yaml_to_json(file_path, output_path)
-            return True
-        # Copy other supported files
-        if file_path.suffix.lower() in self.copy_extensions:
-            # Handle markdown files with preprocessing
-            if file_path.suffix.lower() in {".md", ".mdx"}:
-                self._process_markdown_file(file_path, output_path, target_language)
-                return True
-            shutil.copy2(file_path, output_path)
-            return True
-        return False
+        return copied_count, skipped_count
 
     def is_shared_file(self, file_path: Path) -> bool:
         """Check if a file should be shared between versions rather than duplicated.
@@ -733,39 +1178,16 @@ class DocumentationBuilder:
         Returns:
             True if the file should be shared, False if it should be version-specific.
         """
-        # Shared files: docs.json, images directory, JavaScript files, snippets
-        relative_path = file_path.absolute().relative_to(self.src_dir.absolute())
-
-        # docs.json should be shared
-        if file_path.name == "docs.json":
-            return True
-
-        # index.mdx at root should be shared
-        if file_path.name == "index.mdx" and len(relative_path.parts) == 1:
-            return True
-
-        # use-these-docs.mdx at root should be shared
-        if file_path.name == "use-these-docs.mdx" and len(relative_path.parts) == 1:
-            return True
-
-        # Images directory should be shared
-        if "images" in relative_path.parts:
-            return True
-
-        # Snippets directory should be shared
-        if "snippets" in relative_path.parts:
-            return True
-
-        # JavaScript and CSS files should be shared (used for custom scripts/styles)
-        return file_path.suffix.lower() in {".js", ".css"}
+        relative_path = file_path.absolute().relative_to(self._src_abs)
+        return _is_shared(relative_path.parts, file_path.name, file_path.suffix.lower())
 
     def _copy_shared_files(self) -> None:
         """Copy files that should be shared between versions."""
         # Collect shared files
         shared_files = [
             file_path
-            for file_path in self.src_dir.rglob("*")
-            if file_path.is_file() and self.is_shared_file(file_path)
+            for file_path in _iter_files(self.src_dir)
+            if self.is_shared_file(file_path)
         ]
 
         if not shared_files:
@@ -773,16 +1195,22 @@ class DocumentationBuilder:
             return
 
         copied_count = 0
+        up_to_date_count = 0
         for file_path in shared_files:
-            relative_path = file_path.absolute().relative_to(self.src_dir.absolute())
+            relative_path = file_path.absolute().relative_to(self._src_abs)
             output_path = self.build_dir / relative_path
 
             # Create output directory if needed
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            if file_path.suffix.lower() in self.copy_extensions:
+            self._ensure_parent_dir(output_path)
+
+            suffix = file_path.suffix.lower()
+            if suffix in self.copy_extensions:
+                self._record_output(file_path, output_path)
+                # Leave outputs that are newer than their source alone
+                if self._is_up_to_date(file_path, output_path):
+                    up_to_date_count += 1
                 # Handle markdown files with preprocessing for /oss/ link resolution
-                if file_path.suffix.lower() in {".md", ".mdx"}:
+                elif suffix in MARKDOWN_EXTENSIONS:
                     # For snippet files, we need to handle URL rewriting differently
                     # Use a special marker-based approach for dynamic URL resolution
                     if "snippets" in relative_path.parts:
@@ -796,10 +1224,14 @@ class DocumentationBuilder:
                         self._process_markdown_file(file_path, output_path, None)
                     copied_count += 1
                 else:
-                    shutil.copy2(file_path, output_path)
+                    _copy_file_atomic(file_path, output_path)
                     copied_count += 1
 
-        logger.info("✅ Shared files copied: %d files", copied_count)
+        logger.info(
+            "✅ Shared files copied: %d files, %d already up to date",
+            copied_count,
+            up_to_date_count,
+        )
 
     def _process_snippet_markdown_file(
         self, input_path: Path, output_path: Path
@@ -816,58 +1248,70 @@ class DocumentationBuilder:
         """
         try:
             # Read the source markdown content
-            with input_path.open("r", encoding="utf-8") as f:
-                content = f.read()
+            content = _read_text(input_path)
 
             # Apply standard markdown preprocessing
             processed_content = preprocess_markdown(
                 content, input_path, target_language=None
             )
+            # Drop the source text so only one copy is live for the remaining passes
+            del content
 
             # Convert /oss/ links to relative paths that work from any language context
-            def convert_oss_link(match: re.Match) -> str:
-                """Convert /oss/ links to language-agnostic relative paths.
-
-                IMPORTANT: the conversion creates relative paths that resolve from the
-                parent page's directory.
-                - /oss/providers/groq → ../providers/groq
-                """
-                pre = match.group(1)  # Everything before the URL
-                url = match.group(2)  # The URL
-                post = match.group(3)  # Everything after the URL
-
-                # Only convert absolute /oss/ paths that don't contain 'images' or '/oss/python' or '/oss/javascript'
-                if (
-                    url.startswith("/oss/")
-                    and "images" not in url
-                    and "/oss/python" not in url
-                    and "/oss/javascript" not in url
-                ):
-                    # Convert to relative path that works from oss/python/* or oss/js/*
-                    # e.g., /oss/releases/langchain-v1 becomes ../releases/langchain-v1
-                    parts = url.split("/")
-                    oss_path = "/".join(parts[2:])  # Remove /oss/ prefix
-                    url = f"../{oss_path}"  # Make it relative
-
-                return f"{pre}{url}{post}"
-
-            # Apply URL conversion
-            pattern = r'(\[.*?\]\(|\bhref="|")(/oss/[^")\s]+)([")\s])'
-            processed_content = re.sub(pattern, convert_oss_link, processed_content)
+            if "/oss/" in processed_content:
+                processed_content = _sub_oss_links(
+                    processed_content, _relativize_snippet_oss_url
+                )
 
             # Convert .md to .mdx if needed
             if input_path.suffix.lower() == ".md":
                 output_path = output_path.with_suffix(".mdx")
 
             # Write the processed content
-            with output_path.open("w", encoding="utf-8") as f:
-                f.write(processed_content)
+            _write_bytes_atomic(output_path, processed_content.encode("utf-8"))
 
         except (OSError, UnicodeDecodeError):
             logger.exception(
                 "File I/O or decoding error in snippet markdown file %s", input_path
             )
             raise
-        except re.error:
-            logger.exception("Regex error in snippet markdown file %s", input_path)
-            raise
+
+
+# Builder used by the current process pool worker, set by `_init_build_worker`
+_worker_builder: DocumentationBuilder | None = None
+
+
+def _init_build_worker(
+    src_dir: Path, build_dir: Path, copy_extensions: set[str]
+) -> None:
+    """Create the builder a process pool worker builds its jobs with.
+
+    Args:
+        src_dir: Source directory of the builder that started the pool.
+        build_dir: Build directory of the builder that started the pool.
+        copy_extensions: File extensions that builder copies.
+    """
+    global _worker_builder  # noqa: PLW0603
+    _worker_builder = DocumentationBuilder(src_dir, build_dir)
+    _worker_builder.copy_extensions = copy_extensions
+
+
+def _build_file_in_worker(
+    file_path: Path, output_path: Path, target_language: str | None
+) -> bool:
+    """Build a single file in a process pool worker.
+
+    Args:
+        file_path: Path to the source file.
+        output_path: Full output path where the file should be written.
+        target_language: Target language for conditional blocks ("python" or "js").
+
+    Returns:
+        True if the file was built successfully, False if skipped.
+    """
+    if _worker_builder is None:
+        msg = "Build worker used before _init_build_worker ran"
+        raise RuntimeError(msg)
+    return _worker_builder._build_single_file_to_path(  # noqa: SLF001
+        file_path, output_path, target_language
+    )
@@ -182,14 +182,18 @@ def replace_autolinks(
     processed_lines = []
 
     for line_number, line in enumerate(lines, 1):
-        line_stripped = line.strip()
-
-        # Check if this line defines a new conditional fence scope
-        fence_match = CONDITIONAL_FENCE_PATTERN.match(line_stripped)
-        if fence_match:
-            language = fence_match.group("language")
-            # Set scope to the specified language, or reset to global if no language
-            current_scope = language.lower() if language else default_scope
+        # Substring checks run in C and rule out most lines before any regex runs
+        if ":::" in line:
+            # Check if this line defines a new conditional fence scope
+            fence_match = CONDITIONAL_FENCE_PATTERN.match(line.strip())
+            if fence_match:
+                language = fence_match.group("language")
+                # Set scope to the specified language, or reset to global if none
+                current_scope = language.lower() if language else default_scope
+                processed_lines.append(line)
+                continue
+
+        if "@[" not in line:
             processed_lines.append(line)
             continue
 
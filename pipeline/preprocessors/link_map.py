@@ -5,11 +5,13 @@ to resolve @[link_name] references to actual URLs.
 """
 
 from collections.abc import Mapping
-from typing import TypedDict
+from dataclasses import dataclass
+from types import MappingProxyType
 
 
-class LinkMap(TypedDict):
-    """Typed mapping describing each link map entry."""
+@dataclass(slots=True, frozen=True)
+class LinkMap:
+    """A set of links that share a host and scope."""
 
     host: str
     scope: str
@@ -17,11 +19,11 @@ class LinkMap(TypedDict):
 
 
 LINK_MAPS: list[LinkMap] = [
-    {
+    LinkMap(
         # JS LangGraph reference
-        "host": "https://langchain-ai.github.io/langgraphjs/",
-        "scope": "js",
-        "links": {
+        host="https://langchain-ai.github.io/langgraphjs/",
+        scope="js",
+        links={
             "Auth": "reference/classes/sdk_auth.Auth.html",
             "StateGraph": "reference/classes/langgraph.StateGraph.html",
             "add_conditional_edges": "/reference/classes/langgraph.StateGraph.html#addConditionalEdges",
@@ -66,11 +68,11 @@ LINK_MAPS: list[LinkMap] = [
             "task": "reference/functions/langgraph.task.html",
             "update_state": "reference/classes/langgraph.CompiledStateGraph.html#updateState",
         },
-    },
-    {
-        "host": "https://v03.api.js.langchain.com/",
-        "scope": "js",
-        "links": {
+    ),
+    LinkMap(
+        host="https://v03.api.js.langchain.com/",
+        scope="js",
+        links={
             "AIMessage": "classes/_langchain_core.messages_ai_message.AIMessage.html",
             "AIMessageChunk": "classes/_langchain_core.messages_ai_message.AIMessageChunk.html",
             "BaseChatModel.invoke": "classes/_langchain_core.language_models_chat_models.BaseChatModel.html#invoke",
@@ -84,11 +86,11 @@ LINK_MAPS: list[LinkMap] = [
             "Reference": "index.html",
             "Embeddings": "classes/_langchain_core.embeddings.Embeddings.html",
         },
-    },
-    {
-        "host": "https://reference.langchain.com/python/",
-        "scope": "python",
-        "links": {
+    ),
+    LinkMap(
+        host="https://reference.langchain.com/python/",
+        scope="python",
+        links={
             # Module pages
             "langchain": "langchain/langchain",
             "langchain.agents": "langchain/agents",
@@ -318,36 +320,48 @@ LINK_MAPS: list[LinkMap] = [
             "@entrypoint": "langgraph/func/#langgraph.func.entrypoint",
             "entrypoint.final": "langgraph/func/#langgraph.func.entrypoint.final",
         },
-    },
-    {
-        "host": "https://reference.langchain.com/javascript/",
-        "scope": "js",
-        "links": {
+    ),
+    LinkMap(
+        host="https://reference.langchain.com/javascript/",
+        scope="js",
+        links={
             "Runtime": "modules/langgraph.index.Runtime.html",
             "tool": "functions/_langchain_core.tools.tool.html",
             "ToolNode": "classes/langchain.index.ToolNode.html",
             "UsageMetadata": "types/_langchain_core.messages.UsageMetadata.html",
         },
-    },
+    ),
 ]
 
 
-def _enumerate_links(scope: str) -> dict[str, str]:
-    result = {}
+def _build_scope_link_maps(scopes: tuple[str, ...]) -> dict[str, dict[str, str]]:
+    """Resolve every link map into full URLs, grouped by scope, in one pass.
+
+    Relative links are joined onto their map's host. When several maps of the
+    same scope define a key, the later map wins.
+
+    Args:
+        scopes: Scopes to build. Link maps for any other scope are ignored.
+
+    Returns:
+        Mapping of scope to a mapping of link name to URL.
+    """
+    scope_maps: dict[str, dict[str, str]] = {scope: {} for scope in scopes}
     for link_map in LINK_MAPS:
-        if link_map["scope"] == scope:
-            links = link_map["links"]
-            for key, value in links.items():
-                if not value.startswith("http"):
-                    result[key] = f"{link_map['host']}{value}"
-                else:
-                    result[key] = value
-    return result
+        result = scope_maps.get(link_map.scope)
+        if result is None:
+            continue
+        host = link_map.host
+        for key, value in link_map.links.items():
+            result[key] = value if value.startswith("http") else host + value
+    return scope_maps
 
 
 # Global scope is assembled from the Python and JS mappings
-# Combined mapping by scope
-SCOPE_LINK_MAPS = {
-    "python": _enumerate_links("python"),
-    "js": _enumerate_links("js"),
-}
+# Combined mapping by scope, read-only since every build process shares it
+SCOPE_LINK_MAPS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        scope: MappingProxyType(links)
+        for scope, links in _build_scope_link_maps(("python", "js")).items()
+    }
+)
@@ -14,6 +14,19 @@ from pipeline.preprocessors.handle_auto_links import replace_autolinks
 
 logger = logging.getLogger(__name__)
 
+# Fallback target language, read once since the environment is fixed per build
+DEFAULT_TARGET_LANGUAGE = os.environ.get("TARGET_LANGUAGE", "python")
+
+# Pattern for non-escaped conditional blocks
+CONDITIONAL_BLOCK_PATTERN = re.compile(
+    r"(?P<indent>[ \t]*)(?<!\\):::(?P<language>\w+)\s*\n"
+    r"(?P<content>(?:[^\n]*\n)*?)"  # Capture content inside the block
+    r"(?P=indent)[ \t]*(?<!\\):::"  # Match closing, same indentation, not escaped
+)
+
+# Pattern for escaped conditional tags, unescaped after blocks are resolved
+ESCAPED_CONDITIONAL_PATTERN = re.compile(r"\\(:::)")
+
 
 def _apply_conditional_rendering(md_text: str, target_language: str) -> str:
     r"""Apply conditional rendering to markdown content.
@@ -42,12 +55,9 @@ def _apply_conditional_rendering(md_text: str, target_language: str) -> str:
         msg = "target_language must be 'python' or 'js'"
         raise ValueError(msg)
 
-    # Pattern for non-escaped conditional blocks
-    pattern = re.compile(
-        r"(?P<indent>[ \t]*)(?<!\\):::(?P<language>\w+)\s*\n"
-        r"(?P<content>((?:.*\n)*?))"  # Capture content inside the block
-        r"(?P=indent)[ \t]*(?<!\\):::"  # Match closing, same indentation, not escaped
-    )
+    # Both patterns need a literal ":::", so prose-only pages pass through as is
+    if ":::" not in md_text:
+        return md_text
 
     def replace_conditional_blocks(match: re.Match) -> str:
         """Keep active conditionals."""
@@ -65,10 +75,10 @@ def _apply_conditional_rendering(md_text: str, target_language: str) -> str:
         return ""
 
     # Process conditional blocks first
-    result = pattern.sub(replace_conditional_blocks, md_text)
+    result = CONDITIONAL_BLOCK_PATTERN.sub(replace_conditional_blocks, md_text)
 
     # Then unescape escaped tags by removing the backslash
-    return re.sub(r"\\(:::)", r"\1", result)
+    return ESCAPED_CONDITIONAL_PATTERN.sub(r"\1", result)
 
 
 def preprocess_markdown(
@@ -84,7 +94,8 @@ def preprocess_markdown(
         content: The markdown content to process.
         file_path: Path to the file being processed (for error reporting).
         target_language: Target language for conditional blocks ("python" or "js").
-                        If None, uses TARGET_LANGUAGE environment variable.
+                        If None, uses the TARGET_LANGUAGE environment variable
+                        as read at import time.
         default_scope: Default scope for cross-references. If None,
             uses target_language.
 
@@ -93,14 +104,17 @@ def preprocess_markdown(
     """
     # Determine target language
     if target_language is None:
-        target_language = os.environ.get("TARGET_LANGUAGE", "python")
+        target_language = DEFAULT_TARGET_LANGUAGE
 
     # Determine default scope for cross-references
     if default_scope is None:
         default_scope = target_language
 
-    # Apply cross-reference preprocessing
-    content = replace_autolinks(content, str(file_path), default_scope=default_scope)
+    # Apply cross-reference preprocessing; without "@[" there is nothing to resolve
+    if "@[" in content:
+        content = replace_autolinks(
+            content, str(file_path), default_scope=default_scope
+        )
 
     # Apply conditional rendering for code blocks
     return _apply_conditional_rendering(content, target_language)
@@ -17,6 +17,41 @@ import yaml
 if typing.TYPE_CHECKING:
     from pathlib import Path
 
+# YAML frontmatter at the start of a file
+FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+# :::type [title] ... ::: admonitions
+ADMONITION_PATTERN = re.compile(r":::(\w+)(?:\s+(.+?))?\n(.*?)\n:::", re.DOTALL)
+
+# Tabs/TabItem imports and TabItem elements
+TABS_IMPORT_PATTERN = re.compile(r"import\s+Tabs\s+from\s+['\"]@theme/Tabs['\"];\s*\n?")
+TAB_ITEM_IMPORT_PATTERN = re.compile(
+    r"import\s+TabItem\s+from\s+['\"]@theme/TabItem['\"];\s*\n?"
+)
+TAB_ITEM_PATTERN = re.compile(r"<TabItem\s+([^>]*)>(.*?)</TabItem>", re.DOTALL)
+TAB_LABEL_PATTERN = re.compile(r'label=["\']([^"\']*)["\']')
+
+# Fenced code blocks with an optional title attribute
+CODE_BLOCK_PATTERN = re.compile(
+    r'```(\w+)?(?:\s+title=["\']([^"\']*)["\'])?\s*\n(.*?)\n```', re.DOTALL
+)
+
+# Docusaurus imports that don't have Mintlify equivalents
+DOCUSAURUS_IMPORT_PATTERNS = tuple(
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        r"import\s+.*?\s+from\s+['\"]@docusaurus/.*?['\"];\s*\n?",
+        r"import\s+.*?\s+from\s+['\"]@theme/.*?['\"];\s*\n?",
+        r"import\s+.*?\s+from\s+['\"]@site/.*?['\"];\s*\n?",
+    )
+)
+
+# Markdown links [text](url)
+LINK_PATTERN = re.compile(r"(\[[^\]]+\])\(([^)]+)\)")
+
+# require('@site/static/img/...') asset references
+REQUIRE_PATTERN = re.compile(r'require\(["\'](@site/[^"\']*)["\']\)')
+
 
 @dataclass
 class DocusaurusConfig:
@@ -48,8 +83,7 @@ class DocusaurusParser:
 
     def _parse_frontmatter(self) -> None:
         """Extract and parse YAML frontmatter from the content."""
-        frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(frontmatter_pattern, self.content, re.DOTALL)
+        match = FRONTMATTER_PATTERN.match(self.content)
 
         if match:
             frontmatter_text = match.group(1)
@@ -133,8 +167,6 @@ class DocusaurusParser:
         Content here
         </Note>
         """
-        # Pattern to match Docusaurus admonitions
-        admonition_pattern = r":::(\w+)(?:\s+(.+?))?\n(.*?)\n:::"
 
         def replace_admonition(match: re.Match[str]) -> str:
             admonition_type = match.group(1).lower()
@@ -161,7 +193,7 @@ class DocusaurusParser:
 
             return result
 
-        return re.sub(admonition_pattern, replace_admonition, content, flags=re.DOTALL)
+        return ADMONITION_PATTERN.sub(replace_admonition, content)
 
     def _convert_tabs(self, content: str) -> str:
         """Convert Docusaurus Tabs to Mintlify Tabs.
@@ -184,12 +216,8 @@ class DocusaurusParser:
         </Tabs>
         """
         # Remove import statements for Tabs
-        content = re.sub(
-            r"import\s+Tabs\s+from\s+['\"]@theme/Tabs['\"];\s*\n?", "", content
-        )
-        content = re.sub(
-            r"import\s+TabItem\s+from\s+['\"]@theme/TabItem['\"];\s*\n?", "", content
-        )
+        content = TABS_IMPORT_PATTERN.sub("", content)
+        content = TAB_ITEM_IMPORT_PATTERN.sub("", content)
 
         # Convert TabItem to Tab with title attribute
         def replace_tab_item(match: re.Match[str]) -> str:
@@ -197,14 +225,13 @@ class DocusaurusParser:
             content_match = match.group(2)
 
             # Extract label from attributes
-            label_match = re.search(r'label=["\']([^"\']*)["\']', attributes)
+            label_match = TAB_LABEL_PATTERN.search(attributes)
             title = label_match.group(1) if label_match else "Tab"
 
             return f'<Tab title="{title}">{content_match}</Tab>'
 
         # Replace TabItem tags
-        tab_item_pattern = r"<TabItem\s+([^>]*)>(.*?)</TabItem>"
-        return re.sub(tab_item_pattern, replace_tab_item, content, flags=re.DOTALL)
+        return TAB_ITEM_PATTERN.sub(replace_tab_item, content)
 
     def _convert_code_blocks(self, content: str) -> str:
         """Convert Docusaurus code blocks with special syntax.
@@ -224,21 +251,13 @@ class DocusaurusParser:
 
             return f"```{lang}\n{code_content}\n```"
 
-        # Pattern for code blocks with title
-        code_pattern = r'```(\w+)?(?:\s+title=["\']([^"\']*)["\'])?\s*\n(.*?)\n```'
-        return re.sub(code_pattern, replace_code_block, content, flags=re.DOTALL)
+        return CODE_BLOCK_PATTERN.sub(replace_code_block, content)
 
     def _convert_imports(self, content: str) -> str:
         """Remove or convert Docusaurus import statements."""
         # Remove common Docusaurus imports that don't have Mintlify equivalents
-        imports_to_remove = [
-            r"import\s+.*?\s+from\s+['\"]@docusaurus/.*?['\"];\s*\n?",
-            r"import\s+.*?\s+from\s+['\"]@theme/.*?['\"];\s*\n?",
-            r"import\s+.*?\s+from\s+['\"]@site/.*?['\"];\s*\n?",
-        ]
-
-        for pattern in imports_to_remove:
-            content = re.sub(pattern, "", content, flags=re.MULTILINE)
+        for pattern in DOCUSAURUS_IMPORT_PATTERNS:
+            content = pattern.sub("", content)
 
         return content
 
@@ -294,9 +313,7 @@ class DocusaurusParser:
 
             return match.group(0)  # Return unchanged if no conversion needed
 
-        # Pattern to match markdown links [text](url)
-        link_pattern = r"(\[[^\]]+\])\(([^)]+)\)"
-        return re.sub(link_pattern, replace_link, content)
+        return LINK_PATTERN.sub(replace_link, content)
 
     def _convert_assets(self, content: str) -> str:
         """Convert asset references (images, etc.) to Mintlify format."""
@@ -308,9 +325,7 @@ class DocusaurusParser:
             asset_path = asset_path.removeprefix("@site/")  # Remove '@site/'
             return f'"{asset_path}"'
 
-        # Pattern for require('@site/static/img/...')
-        require_pattern = r'require\(["\'](@site/[^"\']*)["\']\)'
-        return re.sub(require_pattern, replace_require, content)
+        return REQUIRE_PATTERN.sub(replace_require, content)
 
 
 def parse_docusaurus_config(config_path: Path) -> DocusaurusConfig:
@@ -8,6 +8,28 @@ import nbformat
 from nbconvert.exporters import MarkdownExporter
 from nbconvert.preprocessors import Preprocessor
 
+# Markdown links (not images) to relative URLs, defined in parts for clarity
+NOTEBOOK_LINK_PATTERN = re.compile(
+    r"(?<!!)"  # Negative lookbehind: ensure the link is not an image (i.e., doesn't start with "!")
+    r"\["  # Literal '[' indicating the start of the link text.
+    r"(?P<text>[^\]]*)"  # Named group 'text': match any characters except ']', representing the link text.
+    r"\]"  # Literal ']' indicating the end of the link text.
+    r"\("  # Literal '(' indicating the start of the URL.
+    r"(?![^\)]*//)"  # Negative lookahead: ensure that the URL does not contain '//' (skip absolute URLs).
+    r"(?P<url>[^)]*)"  # Named group 'url': match any characters except ')', representing the URL.
+    r"\)"  # Literal ')' indicating the end of the URL.
+)
+# Relative markdown links, with any .ipynb extension dropped (old link logic)
+IPYNB_LINK_PATTERN = re.compile(
+    r"(?<!!)\[([^\]]*)\]\((?![^\)]*//)([^)]*)(?:\.ipynb)?\)"
+)
+# <img> tags pointing into the notebook's local img directory
+IMG_SRC_PATTERN = re.compile(r'<img\s+src="\.?/img/([^"]+)"')
+# Trailing noqa comments in code cells
+NOQA_COMMENT_PATTERN = re.compile(r"#\s*noqa.*$", flags=re.MULTILINE)
+# A numeric reference directly followed by another, e.g. [1][2]
+ADJACENT_REFERENCE_PATTERN = re.compile(r"\[(\d+)\](?=\[(\d+)\])")
+
 
 def _uses_input(source: str) -> bool:
     """Parse the source code to determine if it uses the input() function."""
@@ -169,17 +191,6 @@ def _convert_links_in_markdown(markdown: str) -> str:
     in ipython notebooks do not follow the same conventions as regular markdown
     files in mkdocs (which should link to a .md file).
     """
-    # Define the regex pattern in parts for clarity:
-    pattern = (
-        r"(?<!!)"  # Negative lookbehind: ensure the link is not an image (i.e., doesn't start with "!")
-        r"\["  # Literal '[' indicating the start of the link text.
-        r"(?P<text>[^\]]*)"  # Named group 'text': match any characters except ']', representing the link text.
-        r"\]"  # Literal ']' indicating the end of the link text.
-        r"\("  # Literal '(' indicating the start of the URL.
-        r"(?![^\)]*//)"  # Negative lookahead: ensure that the URL does not contain '//' (skip absolute URLs).
-        r"(?P<url>[^)]*)"  # Named group 'url': match any characters except ')', representing the URL.
-        r"\)"  # Literal ')' indicating the end of the URL.
-    )
 
     def custom_replacement(match):
         """Logic will correct the link format used in ipython notebooks
@@ -209,11 +220,7 @@ def _convert_links_in_markdown(markdown: str) -> str:
         # Otherwise add the .md extension
         return f"[{text}]({url}.md)"
 
-    return re.sub(
-        pattern,
-        custom_replacement,
-        markdown,
-    )
+    return NOTEBOOK_LINK_PATTERN.sub(custom_replacement, markdown)
 
 
 class HideCellTagPreprocessor(Preprocessor):
@@ -242,18 +249,13 @@ class EscapePreprocessor(Preprocessor):
         if cell.cell_type == "markdown":
             if not self.markdown_exec_migration:
                 # Old logic is to convert ipynb links to HTML links
-                cell.source = re.sub(
-                    r"(?<!!)\[([^\]]*)\]\((?![^\)]*//)([^)]*)(?:\.ipynb)?\)",
-                    r"[\1](\2)",
-                    cell.source,
-                )
+                cell.source = IPYNB_LINK_PATTERN.sub(r"[\1](\2)", cell.source)
             else:
                 cell.source = _convert_links_in_markdown(cell.source)
 
             # Fix image paths in <img> tags
-            cell.source = re.sub(
-                r'<img\s+src="\.?/img/([^"]+)"', r'<img src="../img/\1"', cell.source
-            )
+            if "<img" in cell.source:
+                cell.source = IMG_SRC_PATTERN.sub(r'<img src="../img/\1"', cell.source)
 
         elif cell.cell_type == "code":
             # Determine if the cell has bash or cell magic
@@ -269,7 +271,8 @@ class EscapePreprocessor(Preprocessor):
                 cell.metadata["language"] = "shell"
 
             # Remove noqa comments
-            cell.source = re.sub(r"#\s*noqa.*$", "", cell.source, flags=re.MULTILINE)
+            if "noqa" in cell.source:
+                cell.source = NOQA_COMMENT_PATTERN.sub("", cell.source)
             # escape ``` in code
             # This is needed because the markdown exporter will wrap code blocks in
             # triple backticks, which will break the markdown output if the code block
@@ -286,16 +289,20 @@ class EscapePreprocessor(Preprocessor):
 
                         value = output["text"].replace("```", r"\`\`\`")
                         # handle a funky case w/ references in text
-                        value = re.sub(r"\[(\d+)\](?=\[(\d+)\])", r"[\1]\\", value)
+                        if "][" in value:
+                            value = ADJACENT_REFERENCE_PATTERN.sub(r"[\1]\\", value)
                         output["text"] = value
                     elif "data" in output:
                         for key, value in output["data"].items():
                             if isinstance(value, str):
                                 value = value.replace("```", r"\`\`\`")
-                                # handle a funky case w/ references in text
-                                output["data"][key] = re.sub(
-                                    r"\[(\d+)\](?=\[(\d+)\])", r"[\1]\\", value
-                                )
+                                # handle a funky case w/ references in text;
+                                # skips the scan over large payloads like images
+                                if "][" in value:
+                                    value = ADJACENT_REFERENCE_PATTERN.sub(
+                                        r"[\1]\\", value
+                                    )
+                                output["data"][key] = value
                 cell["outputs"] = [
                     output
                     for i, output in enumerate(cell["outputs"])
@@ -20,6 +20,14 @@ from pipeline.tools.lexer import Token, TokenType, lex
 if typing.TYPE_CHECKING:
     from collections.abc import Iterator
 
+# Runs of characters that are not allowed in a heading anchor slug
+SLUG_INVALID_CHARS_PATTERN = re.compile(r"[^a-z0-9]+")
+SLUG_HYPHEN_RUN_PATTERN = re.compile(r"-+")
+
+# Explicit heading anchors: `{#anchor-id}` or a trailing `(anchor-id)`
+HEADING_ACORN_ANCHOR_PATTERN = re.compile(r"\{\s*#\s*([A-Za-z0-9\-_]+)\s*\}")
+HEADING_PAREN_ANCHOR_PATTERN = re.compile(r"\(([^)]+)\)\s*$")
+
 
 class ParseError(Exception):
     """Exception raised when parsing fails with detailed context information."""
@@ -607,26 +615,26 @@ class MintPrinter:
             """Convert arbitrary text to a URL-safe slug."""
             text = text.lower()
             # Replace any sequence of non-alphanumerics with a single hyphen
-            text = re.sub(r"[^a-z0-9]+", "-", text)
+            text = SLUG_INVALID_CHARS_PATTERN.sub("-", text)
             # Collapse consecutive hyphens and trim leading/trailing ones
-            return re.sub(r"-+", "-", text).strip("-")
+            return SLUG_HYPHEN_RUN_PATTERN.sub("-", text).strip("-")
 
         # --- Extract anchor id (explicit or implicit) and clean heading text ---
-        acorn_pattern = r"\{\s*#\s*([A-Za-z0-9\-_]+)\s*\}"
-        paren_pattern = r"\(([^)]+)\)\s*$"  # anchor in trailing parentheses
-
         anchor_id: str | None = None
         heading_text = node.value
 
-        acorn_match = re.search(acorn_pattern, heading_text)
+        acorn_match = HEADING_ACORN_ANCHOR_PATTERN.search(heading_text)
         if acorn_match:
             anchor_id = acorn_match.group(1)
-            heading_text = re.sub(acorn_pattern, "", heading_text).strip()
+            heading_text = HEADING_ACORN_ANCHOR_PATTERN.sub("", heading_text).strip()
         else:
-            paren_match = re.search(paren_pattern, heading_text)
+            # Anchor in trailing parentheses
+            paren_match = HEADING_PAREN_ANCHOR_PATTERN.search(heading_text)
             if paren_match:
                 anchor_id = paren_match.group(1)
-                heading_text = re.sub(paren_pattern, "", heading_text).strip()
+                heading_text = HEADING_PAREN_ANCHOR_PATTERN.sub(
+                    "", heading_text
+                ).strip()
 
         if anchor_id:
             anchor_id = _slugify(anchor_id)
@@ -11,10 +11,19 @@ uv run python pipeline/tools/partner_pkg_table.py
 ```
 """
 
+import heapq
+import os
+import re
 from pathlib import Path
 
 import yaml
 
+try:
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 # Packages to exclude from the table
 IGNORE_PKG = {
     "langchain-cli",
@@ -32,13 +41,48 @@ IGNORE_PKG = {
 # Minimum downloads threshold for inclusion (bypassed for highlighted packages)
 MIN_DOWNLOADS = 100_000
 
+# Hyphens become spaces and "db"/"ai" anywhere in a title-cased name are uppercased
+TITLE_FIXUP_PATTERN = re.compile(r"-|[Dd]b|[Aa]i")
+
 DOCS_DIR = Path(__file__).parents[2]
 PROVIDERS_PATH = Path() / "src" / "oss" / "python" / "integrations" / "providers"
 PACKAGE_YML = Path() / "reference" / "packages.yml"
 
 # Load package registry
 with PACKAGE_YML.open() as f:
-    PACKAGE_YML = yaml.safe_load(f)
+    PACKAGE_YML = yaml.load(f, Loader=SafeLoader)
+
+
+def _list_provider_page_stems(providers_dir: Path) -> frozenset[str]:
+    """Collect every name that has a provider page in `providers_dir`.
+
+    A name counts when some entry is named `<name>.<anything>`, matching what
+    `providers_dir.glob(f"{name}.*")` would find, so each package is checked
+    with a set lookup instead of its own directory scan.
+
+    Args:
+        providers_dir: Directory holding the provider pages.
+
+    Returns:
+        Set of names with a provider page. Empty if the directory is missing.
+    """
+    stems = set()
+    try:
+        with os.scandir(providers_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                dot = name.find(".")
+                while dot != -1:
+                    stems.add(name[:dot])
+                    dot = name.find(".", dot + 1)
+    except FileNotFoundError:
+        return frozenset()
+    return frozenset(stems)
+
+
+PROVIDER_PAGE_STEMS = _list_provider_page_stems(DOCS_DIR / PROVIDERS_PATH)
 
 
 # For now, only include packages that are in the langchain-ai org
@@ -65,6 +109,12 @@ def _get_type(package: dict) -> str:
     return "third-party"
 
 
+def _fix_title_token(match: re.Match[str]) -> str:
+    """Return the replacement for a token matched by `TITLE_FIXUP_PATTERN`."""
+    text = match.group(0)
+    return " " if text == "-" else text.upper()
+
+
 def _enrich_package(p: dict) -> dict | None:
     """Enrich package metadata with additional fields.
 
@@ -80,9 +130,9 @@ def _enrich_package(p: dict) -> dict | None:
 
     # If a title is not provided, use the short name with title case and
     # special handling for common terms/acronyms
-    p["name_title"] = p.get("name_title") or p["name_short"].title().replace(
-        "-", " "
-    ).replace("db", "DB").replace("Db", "DB").replace("ai", "AI").replace("Ai", "AI")
+    p["name_title"] = p.get("name_title") or TITLE_FIXUP_PATTERN.sub(
+        _fix_title_token, p["name_short"].title()
+    )
 
     # Determine package type based on repo and name
     p["type"] = _get_type(p)
@@ -95,9 +145,7 @@ def _enrich_package(p: dict) -> dict | None:
 
     # Determine provider page URL
     default_provider_page = f"/oss/integrations/providers/{p['name_short']}/"
-    default_provider_page_exists = any(
-        (DOCS_DIR / PROVIDERS_PATH).glob(f"{p['name_short']}.*")
-    )
+    default_provider_page_exists = p["name_short"] in PROVIDER_PAGE_STEMS
 
     if custom_provider_page := p.get("provider_page"):
         # First priority: custom provider page specified in YAML
@@ -142,15 +190,14 @@ PACKAGES = [
     if p.get("highlight", False) or p.get("downloads", 0) >= MIN_DOWNLOADS
 ]
 
-# Sort by highlight status (highlighted first), then by downloads
-PACKAGES_SORTED = sorted(
+# Keep the top 50 by highlight status (highlighted first), then by downloads;
+# nsmallest matches sorted(...)[:50] without sorting the whole list
+PACKAGES_SORTED = heapq.nsmallest(
+    50,
     PACKAGES,
     key=lambda p: (not p.get("highlight", False), -p.get("downloads", 0)),
 )
 
-# Truncate to top 50 by total downloads
-PACKAGES_SORTED = PACKAGES_SORTED[:50]
-
 
 def package_row(p: dict) -> str:
     """Generate a markdown table row for a package."""
@@ -158,11 +205,12 @@ def package_row(p: dict) -> str:
     link = p["provider_page"]
     title = p["name_title"]
     provider = f"[{title}]({link})" if link else title
+    name = p["name"]
     return (
         f"| {provider} "
-        f"| [`{p['name']}`]({p['package_url']}) "
-        f'| <a href="https://pypi.org/project/{p["name"]}/" target="_blank"><img src="https://static.pepy.tech/badge/{p["name"]}/month" alt="Downloads per month" noZoom class="rounded not-prose" /></a> '  # noqa: E501
-        f'| <a href="https://pypi.org/project/{p["name"]}/" target="_blank"><img src="https://img.shields.io/pypi/v/{p["name"]}?style=flat-square&label=%20" alt="PyPI - Latest version" noZoom class="rounded not-prose" /></a> '  # noqa: E501
+        f"| [`{name}`]({p['package_url']}) "
+        f'| <a href="https://pypi.org/project/{name}/" target="_blank"><img src="https://static.pepy.tech/badge/{name}/month" alt="Downloads per month" noZoom class="rounded not-prose" /></a> '  # noqa: E501
+        f'| <a href="https://pypi.org/project/{name}/" target="_blank"><img src="https://img.shields.io/pypi/v/{name}?style=flat-square&label=%20" alt="PyPI - Latest version" noZoom class="rounded not-prose" /></a> '  # noqa: E501
         f"| {js} |"
     )
 
@@ -214,5 +262,9 @@ Community integrations can be found in [`langchain-community`](https://github.co
 
 if __name__ == "__main__":
     output_dir = Path() / "src" / "oss" / "python" / "integrations" / "providers"
-    with (output_dir / "overview.mdx").open("w") as f:
-        f.write(doc())
+    output_path = output_dir / "overview.mdx"
+    content = doc()
+    # Leave an unchanged page untouched so its mtime does not force a rebuild
+    if not output_path.exists() or output_path.read_text() != content:
+        with output_path.open("w") as f:
+            f.write(content)
@@ -5,10 +5,13 @@ covering all methods and edge cases including file extension handling,
 directory structure preservation, and error conditions.
 """
 
+import json
+import os
 from pathlib import Path
 
 import pytest
 
+from pipeline.core import builder as builder_module
 from pipeline.core.builder import DocumentationBuilder
 from tests.unit_tests.utils import File, file_system
 
@@ -267,3 +270,241 @@ def test_build_nonexistent_file() -> None:
         builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
         with pytest.raises(AssertionError):
             builder.build_file(fs.src_dir / "nonexistent.md")
+
+
+def test_build_all_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that building in worker processes matches the in-process build.
+
+    Forces the process pool path by lowering the parallel threshold and
+    verifies the output tree and file contents are identical. The pooled run
+    cleans the build directory first, so every output is written by a worker.
+    """
+    files = [
+        File(
+            path=f"oss/guides/page_{i}.mdx",
+            content=f"# Page {i}\n:::python\nPython\n:::\n:::js\nJS\n:::\n",
+        )
+        for i in range(4)
+    ] + [
+        File(path="langsmith/index.mdx", content="# LangSmith"),
+        File(path="oss/images/logo.png", bytes=b"PNG_DATA"),
+    ]
+
+    with file_system(files) as fs:
+        DocumentationBuilder(fs.src_dir, fs.build_dir).build_all()
+        expected = {
+            path: (fs.build_dir / path).read_bytes() for path in fs.list_build_files()
+        }
+
+        monkeypatch.setattr(builder_module, "PARALLEL_BUILD_MIN_FILES", 1)
+        DocumentationBuilder(fs.src_dir, fs.build_dir).build_all(clean=True)
+        actual = {
+            path: (fs.build_dir / path).read_bytes() for path in fs.list_build_files()
+        }
+
+    assert actual == expected
+    assert b"Python" in expected[Path("oss/python/guides/page_0.mdx")]
+    assert b"JS" not in expected[Path("oss/python/guides/page_0.mdx")]
+
+
+def test_build_file_skips_up_to_date_output() -> None:
+    """Test that rebuilding an unchanged file leaves its output untouched.
+
+    Verifies that an output newer than its source is not rewritten, and that
+    touching the source makes the next build write the output again.
+    """
+    files = [File(path="guides/setup.md", content="# Setup Guide")]
+
+    with file_system(files) as fs:
+        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
+        source = fs.src_dir / "guides/setup.md"
+        output = fs.build_dir / "guides/setup.mdx"
+
+        builder.build_file(source)
+        output.write_text("stale", encoding="utf-8")
+        builder.build_file(source)
+        assert output.read_text(encoding="utf-8") == "stale"
+
+        output_mtime_ns = output.stat().st_mtime_ns
+        os.utime(source, ns=(output_mtime_ns + 1, output_mtime_ns + 1))
+        builder.build_file(source)
+        assert "# Setup Guide" in output.read_text(encoding="utf-8")
+
+
+def test_build_file_interrupted_copy_leaves_no_output(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a copy failing part way leaves no truncated output behind.
+
+    Verifies that the next build writes the output in full, instead of keeping
+    a partial file that is newer than its source.
+    """
+    files = [File(path="images/logo.png", content="x" * 100)]
+
+    with file_system(files) as fs:
+        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
+        source = fs.src_dir / "images/logo.png"
+        output = fs.build_dir / "images/logo.png"
+
+        def interrupted_copyfile(src: Path, dst: Path) -> None:
+            Path(dst).write_bytes(Path(src).read_bytes()[:10])
+            msg = "disk full"
+            raise OSError(msg)
+
+        with monkeypatch.context() as m:
+            m.setattr(builder_module.shutil, "copyfile", interrupted_copyfile)
+            with pytest.raises(OSError, match="disk full"):
+                builder.build_file(source)
+        assert list(output.parent.iterdir()) == []
+
+        builder.build_file(source)
+        assert output.read_bytes() == source.read_bytes()
+
+
+def test_build_all_language_override_wins() -> None:
+    """Test that a language-specific file replaces the shared file it shadows.
+
+    Covers a root-level page and a nested one whose directory name sorts after
+    `python`, so the result cannot depend on the order files are found in.
+    """
+    files = [
+        File(path="oss/page.mdx", content="shared"),
+        File(path="oss/python/page.mdx", content="python override"),
+        File(path="oss/zzz/foo.mdx", content="shared"),
+        File(path="oss/python/zzz/foo.mdx", content="python override"),
+    ]
+
+    with file_system(files) as fs:
+        DocumentationBuilder(fs.src_dir, fs.build_dir).build_all()
+
+        for page in ("page.mdx", "zzz/foo.mdx"):
+            python_page = fs.build_dir / "oss/python" / page
+            js_page = fs.build_dir / "oss/javascript" / page
+            assert "python override" in python_page.read_text(encoding="utf-8")
+            assert "shared" in js_page.read_text(encoding="utf-8")
+
+
+def test_iter_files_matches_rglob_order() -> None:
+    """Test that the scandir walk yields files in the same order as rglob."""
+    files = [
+        File(path=f"oss/{directory}/foo.mdx", content=directory)
+        for directory in ("zzz", "qqq", "a", "a/b", "python/zzz", "python/qqq")
+    ] + [File(path="oss/top.mdx", content="top")]
+
+    with file_system(files) as fs:
+        expected = [path for path in fs.src_dir.rglob("*") if path.is_file()]
+        assert list(builder_module._iter_files(fs.src_dir)) == expected
+
+
+def test_build_all_rebuilds_after_override_removed() -> None:
+    """Test that deleting a language override rebuilds from the shared page.
+
+    The output written from the override is newer than the shared source, so
+    only the change to the override's directory can tell it is out of date.
+    """
+    files = [
+        File(path="oss/page.mdx", content="shared"),
+        File(path="oss/python/page.mdx", content="python override"),
+        File(path="oss/guides/intro.mdx", content="shared"),
+        File(path="oss/python/guides/intro.mdx", content="python override"),
+    ]
+
+    with file_system(files) as fs:
+        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
+        builder.build_all()
+
+        for page in ("page.mdx", "guides/intro.mdx"):
+            (fs.src_dir / "oss/python" / page).unlink()
+        (fs.src_dir / "oss/python/guides").rmdir()
+        builder.build_all()
+
+        for page in ("page.mdx", "guides/intro.mdx"):
+            python_page = fs.build_dir / "oss/python" / page
+            assert "shared" in python_page.read_text(encoding="utf-8")
+
+
+def test_build_all_rebuilds_docs_yml_after_override_removed() -> None:
+    """Test that deleting a language override of a docs.yml rebuilds its JSON."""
+    files = [
+        File(path="oss/guides/docs.yml", content="name: shared\n"),
+        File(path="oss/python/guides/docs.yml", content="name: python\n"),
+    ]
+
+    with file_system(files) as fs:
+        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
+        builder.build_all()
+        output = fs.build_dir / "oss/python/guides/docs.json"
+        assert json.loads(output.read_bytes()) == {"name": "python"}
+
+        (fs.src_dir / "oss/python/guides/docs.yml").unlink()
+        (fs.src_dir / "oss/python/guides").rmdir()
+        builder.build_all()
+
+        assert json.loads(output.read_bytes()) == {"name": "shared"}
+
+
+def test_build_all_removes_stale_outputs() -> None:
+    """Test that rebuilding removes outputs the build no longer produces.
+
+    Verifies that files without a source are deleted along with directories
+    left empty, while up-to-date outputs are kept as they are.
+    """
+    files = [File(path="langsmith/index.mdx", content="# LangSmith")]
+
+    with file_system(files) as fs:
+        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
+        builder.build_all()
+        index = fs.build_dir / "langsmith/index.mdx"
+        index.write_text("kept", encoding="utf-8")
+        (fs.build_dir / "old/guides").mkdir(parents=True)
+        (fs.build_dir / "old/guides/removed.mdx").write_text("stale", encoding="utf-8")
+
+        builder.build_all()
+        assert fs.list_build_files() == [Path("langsmith/index.mdx")]
+        assert not (fs.build_dir / "old").exists()
+        assert index.read_text(encoding="utf-8") == "kept"
+
+        builder.build_all(clean=True)
+        assert "# LangSmith" in index.read_text(encoding="utf-8")
+
+
+def test_build_file_streams_large_docs_yml(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that streaming a large docs.yml writes the same JSON document."""
+    files = [
+        File(path="langsmith/docs.yml", content="name: test\nnav:\n  - a: é\n"),
+    ]
+
+    with file_system(files) as fs:
+        source = fs.src_dir / "langsmith/docs.yml"
+        output = fs.build_dir / "langsmith/docs.json"
+        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
+
+        builder.build_file(source)
+        expected = output.read_bytes()
+        output.unlink()
+
+        monkeypatch.setattr(builder_module, "STREAM_JSON_MIN_BYTES", 0)
+        builder.build_file(source)
+
+        assert output.read_bytes() == expected
+        assert not output.with_suffix(".json.tmp").exists()
+        assert json.loads(expected) == {"name": "test", "nav": [{"a": "é"}]}
+
+
+def test_sub_oss_links_matches_link_pattern() -> None:
+    """Test that the /oss/ link scanner rewrites the same URLs as the regex."""
+    contents = [
+        'See [models](/oss/models) and <a href="/oss/agents">agents</a>.\n',
+        '[see "/oss/quoted"](/oss/target) [two](/oss/a)(/oss/b)\n',
+        '"/oss/a""/oss/b" "/oss/a"/oss/b" [x](/oss/images/logo.png)\n',
+        "[a](/oss/a) b](/oss/b)\n](/oss/next-line) [c](/oss/unterminated",
+    ]
+
+    def rewrite(url: str) -> str:
+        return url.upper()
+
+    for content in contents:
+        expected = builder_module.OSS_LINK_PATTERN.sub(
+            lambda m: m.group(1) + rewrite(m.group(2)) + m.group(3), content
+        )
+        assert builder_module._sub_oss_links(content, rewrite) == expected